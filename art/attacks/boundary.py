@@ -18,6 +18,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
+from functools import lru_cache
 
 import numpy as np
 
@@ -25,6 +26,45 @@ from art.attacks.attack import Attack
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Conditional import of `numba` to compile the numeric kernel of the orthogonal step when available
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @lru_cache(maxsize=None)
+    def _make_orthogonal_perturb_kernel(dim):
+        """
+        Build a compiled orthogonal-step kernel specialized for a fixed flattened sample dimension. Closing over
+        `dim` turns the hot inner loop bound into a compile-time constant, letting LLVM elide bounds checks and
+        unroll small dimensions; numba itself specializes the kernel per dtype. The trial count stays a runtime
+        argument because the adaptive budget changes it between iterations, and keying the cache on it would
+        trigger a fresh JIT compilation per distinct value. Compiled kernels are cached per `dim`.
+        """
+        @njit(parallel=True, fastmath=True)
+        def _kernel(perturb, noise, current, original, delta):
+            # Rescale and project the shared unit-norm noise basis `noise` of shape `(nb_trials, dim)` into
+            # `perturb` of shape `(N, nb_trials, dim)`, parallelized over the batch dimension. Only the random
+            # draw and `classifier.predict` stay outside this kernel.
+            nb_samples = perturb.shape[0]
+            nb_trials = perturb.shape[1]
+            for i in prange(nb_samples):
+                direction = original[i] - current[i]
+                direction_norm = np.sqrt(np.dot(direction, direction))
+                # The float64 literal would promote `unit` and break np.dot against float32 noise, so cast back
+                unit = (direction / (direction_norm + 1e-12)).astype(noise.dtype)
+                scale = delta[i] * direction_norm
+
+                for t in range(nb_trials):
+                    dot = np.dot(noise[t], unit)
+                    for d in range(dim):
+                        perturb[i, t, d] = scale * (noise[t, d] - dot * unit[d])
+
+        return _kernel
+
 
 class BoundaryAttack(Attack):
     """
@@ -32,10 +72,10 @@ class BoundaryAttack(Attack):
     Paper link: https://arxiv.org/abs/1712.04248
     """
     attack_params = Attack.attack_params + ['targeted', 'delta', 'epsilon', 'step_adapt',
-                                            'max_iter', 'sample_size', 'init_size']
+                                            'max_iter', 'sample_size', 'init_size', 'use_fp16_probe']
 
     def __init__(self, classifier, targeted=True, delta=0.01, epsilon=0.01, step_adapt=0.9, max_iter=100,
-                 sample_size=20, init_size=100):
+                 sample_size=20, init_size=100, use_fp16_probe=False):
         """
         Create a boundary attack instance.
 
@@ -55,6 +95,9 @@ class BoundaryAttack(Attack):
         :type sample_size: `int`
         :param init_size: Maximum number of trials for initial generation of adversarial examples.
         :type init_size: `int`
+        :param use_fp16_probe: Draw the random init candidates in half precision to reduce memory traffic and
+               host-to-device transfer. Requires a classifier that accepts float16 inputs.
+        :type use_fp16_probe: `bool`
         """
         super(BoundaryAttack, self).__init__(classifier=classifier)
         params = {'targeted': targeted,
@@ -63,8 +106,11 @@ class BoundaryAttack(Attack):
                   'step_adapt': step_adapt,
                   'max_iter': max_iter,
                   'sample_size': sample_size,
-                  'init_size': init_size}
+                  'init_size': init_size,
+                  'use_fp16_probe': use_fp16_probe}
         self.set_params(**params)
+        # Seed the generator from the legacy global RNG so that `master_seed` keeps controlling the attack
+        self._rng = np.random.default_rng(np.random.randint(0, 2 ** 32, dtype=np.uint32))
 
     def generate(self, x, **kwargs):
         """
@@ -88,6 +134,9 @@ class BoundaryAttack(Attack):
         :type sample_size: `int`
         :param init_size: Maximum number of trials for initial generation of adversarial examples.
         :type init_size: `int`
+        :param use_fp16_probe: Draw the random init candidates in half precision to reduce memory traffic and
+               host-to-device transfer. Requires a classifier that accepts float16 inputs.
+        :type use_fp16_probe: `bool`
         :return: An array holding the adversarial examples.
         :rtype: `np.ndarray`
         """
@@ -95,8 +144,11 @@ class BoundaryAttack(Attack):
         params_cpy = dict(kwargs)
         y = params_cpy.pop(str('y'), None)
 
+        # Cache shape-invariant constants and hot attribute lookups for the whole attack
+        clip_min, clip_max = self.classifier.clip_values
+
         # Prediction from the original images
-        preds = np.argmax(self.classifier.predict(x), axis=1)
+        preds = self._predict_classes(x)
 
         # Assert that, if attack is targeted, y is provided
         if self.targeted and y is None:
@@ -106,220 +158,295 @@ class BoundaryAttack(Attack):
         x_adv = x.copy()
         if y is not None:
             y = np.argmax(y, axis=1)
+        targets = y if self.targeted else preds
 
-        # Generate the adversarial samples
-        for ind, val in enumerate(x_adv):
-            if self.targeted:
-                x_ = self._perturb(x=val, y=y[ind], y_p=preds[ind])
-            else:
-                x_ = self._perturb(x=val, y=None, y_p=preds[ind])
-
-            x_adv[ind] = x_
-
-        logger.info('Success rate of Boundary attack: %.2f%%',
-                    (np.sum(preds != np.argmax(self.classifier.predict(x_adv), axis=1)) / x.shape[0]))
-
-        return x_adv
-
-    def _perturb(self, x, y, y_p):
-        """
-        Internal attack function for one example.
+        # Create an initial adversarial example for each input
+        init_samples, init_found, init_classes = self._init_sample(x, y, preds, clip_min, clip_max)
+        logger.info('Found initial adversarial images for %d/%d samples.', np.sum(init_found), x.shape[0])
 
-        :param x: An array with one original input to be attacked.
-        :type x: `np.ndarray`
-        :param y: If `self.targeted` is true, then `y` represents the target label.
-        :type y: `int`
-        :param y_p: The predicted label of x.
-        :type y_p: `int`
-        :return: an adversarial example.
-        """
-        # First, create an initial adversarial sample
-        initial_sample = self._init_sample(x, y, y_p)
+        # Run the boundary attack on all inputs with an initial adversarial example as one batch. The predicted
+        # labels of the adversarial examples are tracked throughout the attack, so no extra prediction call is
+        # needed for the success-rate bookkeeping below.
+        preds_adv = preds.copy()
+        if np.any(init_found):
+            x_adv[init_found], preds_adv[init_found] = self._attack(
+                init_samples[init_found], x[init_found], targets[init_found], init_classes[init_found],
+                self.delta, self.epsilon, clip_min, clip_max)
 
-        # If an initial adversarial example is not found, then return the original image
-        if initial_sample is None:
-            return x
-
-        # If an initial adversarial example found, then go with boundary attack
-        if self.targeted:
-            x_adv = self._attack(initial_sample, x, y, self.delta, self.epsilon)
-        else:
-            x_adv = self._attack(initial_sample, x, y_p, self.delta, self.epsilon)
+        success_rate = np.count_nonzero(preds != preds_adv) / x.shape[0]
+        logger.info('Success rate of Boundary attack: %.2f%%', 100 * success_rate)
 
         return x_adv
 
-    def _attack(self, initial_sample, original_sample, target, initial_delta, initial_epsilon):
+    def _attack(self, initial_samples, original_samples, targets, initial_classes, initial_delta, initial_epsilon,
+                clip_min, clip_max):
         """
-        Main function for the boundary attack.
-
-        :param initial_sample: An initial adversarial example.
-        :type initial_sample: `np.ndarray`
-        :param original_sample: The original input.
-        :type original_sample: `np.ndarray`
-        :param target: If `self.targeted` is true, then `target` represents the target label, otherwise the
-        predicted label of the original sample.
-        :type target: `int`
+        Main function for the boundary attack, operating on a batch of inputs simultaneously.
+
+        :param initial_samples: An array of initial adversarial examples.
+        :type initial_samples: `np.ndarray`
+        :param original_samples: An array with the original inputs.
+        :type original_samples: `np.ndarray`
+        :param targets: If `self.targeted` is true, then `targets` represents the target labels, otherwise the
+        predicted labels of the original samples.
+        :type targets: `np.ndarray`
+        :param initial_classes: The predicted labels of the initial adversarial examples.
+        :type initial_classes: `np.ndarray`
         :param initial_delta: Initial step size for the orthogonal step.
         :type initial_delta: `float`
         :param initial_epsilon: Initial step size for the step towards the target.
         :type initial_epsilon: `float`
-        :return: an adversarial example.
-        :rtype: `np.ndarray`
+        :param clip_min: Minimum clip value of the classifier inputs.
+        :type clip_min: `float`
+        :param clip_max: Maximum clip value of the classifier inputs.
+        :type clip_max: `float`
+        :return: a tuple of an array of adversarial examples and an array with their predicted labels.
+        :rtype: `tuple`
         """
         # Get initialization for some variables
-        x_adv = initial_sample
-        delta = initial_delta
-        epsilon = initial_epsilon
-        clip_min, clip_max = self.classifier.clip_values
+        x_adv = initial_samples
+        labels_adv = initial_classes.copy()
+        nb_samples = x_adv.shape[0]
+        sample_shape = x_adv.shape[1:]
+        delta = np.full(nb_samples, initial_delta)
+        epsilon = np.full(nb_samples, initial_epsilon)
+        fail_streak = np.zeros(nb_samples, dtype=int)
+        predict_classes = self._predict_classes
+
+        # Pre-allocate the candidate buffer once and refill it in place every iteration
+        potential_advs = np.empty((nb_samples, self.sample_size) + sample_shape, dtype=x_adv.dtype)
+
+        # Samples are dropped from the working set once they stop making progress
+        active = np.ones(nb_samples, dtype=bool)
+
+        # Per-sample trial budget, adapted from a smoothed success rate of the orthogonal step: samples whose
+        # trials succeed often need fewer of them, which cuts the number of candidates sent to the classifier.
+        # The smoothed rate starts low so every sample begins with the full sample_size budget and only sheds
+        # trials once successes actually accumulate.
+        trial_success_rate = np.full(nb_samples, 0.5 / self.sample_size)
 
         # Main loop to wander around the boundary
         for _ in range(self.max_iter):
-            # Trust region method to adjust delta
-            for _ in range(self.max_iter):
-                potential_advs = []
-                for _ in range(self.sample_size):
-                    potential_adv = x_adv + self._orthogonal_perturb(delta, x_adv, original_sample)
-                    potential_adv = np.clip(potential_adv, clip_min, clip_max)
-                    potential_advs.append(potential_adv)
-
-                preds = np.argmax(self.classifier.predict(np.array(potential_advs)), axis=1)
-
-                if self.targeted:
-                    satisfied = (preds == target)
-                else:
-                    satisfied = (preds != target)
-
-                delta_ratio = np.mean(satisfied)
-
-                if delta_ratio < 0.5:
-                    delta *= self.step_adapt
-                else:
-                    delta /= self.step_adapt
-
-                if delta_ratio > 0:
-                    x_adv = potential_advs[np.where(satisfied)[0][0]]
-                    break
+            if not np.any(active):
+                break
+            act = np.where(active)[0]
+            nb_active = act.size
+
+            # Orthogonal step for all active samples at once, with trust region method to adjust delta
+            trials = np.clip(np.rint(0.5 / (trial_success_rate[act] + 1e-6)).astype(int), 1, self.sample_size)
+            nb_trials = int(trials.max())
+            trial_mask = np.arange(nb_trials)[np.newaxis, :] < trials[:, np.newaxis]
+
+            candidates = potential_advs[:nb_active, :nb_trials]
+            perturbs = self._orthogonal_perturb(delta[act], x_adv[act], original_samples[act], nb_trials)
+            np.add(x_adv[act][:, np.newaxis], perturbs, out=candidates)
+            np.clip(candidates, clip_min, clip_max, out=candidates)
+
+            # Only candidates within each sample's trial budget are classified
+            sel_rows, sel_trials = np.where(trial_mask)
+            preds = np.full((nb_active, nb_trials), -1, dtype=int)
+            preds[sel_rows, sel_trials] = predict_classes(candidates[sel_rows, sel_trials])
 
+            if self.targeted:
+                satisfied = (preds == targets[act][:, np.newaxis])
             else:
-                logging.warning('Adversarial example found but not optimal.')
-                return x_adv
-
-            # Trust region method to adjust epsilon
-            for _ in range(self.max_iter):
-                perturb = original_sample - x_adv
-                perturb *= epsilon
-                potential_adv = x_adv + perturb
-                potential_adv = np.clip(potential_adv, clip_min, clip_max)
-                pred = np.argmax(self.classifier.predict(np.array([potential_adv])), axis=1)[0]
-
-                if self.targeted:
-                    satisfied = (pred == target)
-                else:
-                    satisfied = (pred != target)
-
-                if satisfied:
-                    x_adv = potential_adv
-                    epsilon /= self.step_adapt
-                    break
-                else:
-                    epsilon *= self.step_adapt
+                satisfied = (preds != targets[act][:, np.newaxis])
+            satisfied &= trial_mask
+
+            delta_ratio = satisfied.sum(axis=1) / trials
+            # Keep the relative step size bounded: without the cap, a success ratio that stays >= 0.5 (e.g. at
+            # box-clip saturation) grows delta exponentially and degenerates the attack into random search
+            delta[act] = np.clip(np.where(delta_ratio < 0.5, delta[act] * self.step_adapt,
+                                          delta[act] / self.step_adapt), 1e-6, 1.0)
+            trial_success_rate[act] = 0.5 * trial_success_rate[act] + 0.5 * delta_ratio
+
+            # Samples with at least one successful trial move to their first successful candidate
+            success = satisfied.any(axis=1)
+            first_satisfied = np.argmax(satisfied, axis=1)
+            moved = act[success]
+            x_adv[moved] = candidates[success, first_satisfied[success]]
+            labels_adv[moved] = preds[success, first_satisfied[success]]
+
+            # Fail-safe: reset the orthogonal step size for samples stuck in a long failure streak, and retire
+            # samples that do not recover afterwards
+            fail_streak[act] = np.where(success, 0, fail_streak[act] + 1)
+            delta[fail_streak == 50] = initial_delta
+            active[fail_streak >= 100] = False
+
+            if moved.size == 0:
+                continue
+
+            # Step towards the original samples, with trust region method to adjust epsilon. The difference
+            # array is reused in place for the candidates, so beyond the gather copies and the subtraction the
+            # scale, add and clip steps allocate nothing further.
+            x_adv_moved = x_adv[moved]
+            potential_adv = np.subtract(original_samples[moved], x_adv_moved)
+            potential_adv *= epsilon[moved].reshape((-1,) + (1,) * len(sample_shape))
+            np.add(x_adv_moved, potential_adv, out=potential_adv)
+            np.clip(potential_adv, clip_min, clip_max, out=potential_adv)
+            preds = predict_classes(potential_adv)
 
+            if self.targeted:
+                satisfied = (preds == targets[moved])
             else:
-                logging.warning('Adversarial example found but not optimal.')
-                return x_adv
+                satisfied = (preds != targets[moved])
 
-        return x_adv
+            x_adv[moved[satisfied]] = potential_adv[satisfied]
+            labels_adv[moved[satisfied]] = preds[satisfied]
+            # Cap epsilon strictly below 1: a full step would land on (or past) the original sample
+            epsilon[moved] = np.clip(np.where(satisfied, epsilon[moved] / self.step_adapt,
+                                              epsilon[moved] * self.step_adapt), 1e-6, 1.0 - 1e-6)
 
-    def _orthogonal_perturb(self, delta, current_sample, original_sample):
-        """
-        Create an orthogonal perturbation.
+        return x_adv, labels_adv
 
-        :param delta: Initial step size for the orthogonal step.
-        :type delta: `float`
-        :param current_sample: Current adversarial example.
-        :type current_sample: `np.ndarray`
-        :param original_sample: The original input.
-        :type original_sample: `np.ndarray`
-        :return: a possible perturbation.
+    def _predict_classes(self, x):
         """
-        # Generate perturbation randomly
-        perturb = np.random.randn(current_sample.shape[0], current_sample.shape[1], current_sample.shape[2])
-
-        # Rescale the perturbation
-        perturb /= np.linalg.norm(perturb)
-        perturb *= delta * np.linalg.norm(original_sample - current_sample)
-
-        # Project the perturbation onto sphere
-        direction = original_sample - current_sample
-        perturb = np.swapaxes(perturb, 0, self.classifier.channel_index - 1)
-        direction = np.swapaxes(direction, 0, self.classifier.channel_index - 1)
+        Compute the predicted classes for a batch of inputs.
 
-        for i in range(len(direction)):
-            direction[i] /= np.linalg.norm(direction[i])
-            perturb[i] -= np.dot(perturb[i], direction[i]) * direction[i]
+        Classifiers may expose a `predict_class` method returning top-1 labels directly; backends can use it to
+        run the argmax on device and skip materializing the full `(N, nb_classes)` logits on the host. When it is
+        not available, this falls back to an argmax over `predict`.
 
-        perturb = np.swapaxes(perturb, 0, self.classifier.channel_index - 1)
-
-        # direction = original_sample - current_sample
-        # norm_direction = np.linalg.norm(direction)
-        # direction /= norm_direction
-        # vdot = np.vdot(perturb, direction)
-        # perturb -= vdot * direction
-        # perturb *= delta * norm_direction / np.linalg.norm(perturb)
-        # d = 1.0 / np.sqrt(delta ** 2 + 1)
-        # direction = perturb - (original_sample - current_sample)
-        # perturb = d * direction
-
-        return perturb
+        :param x: An array of inputs.
+        :type x: `np.ndarray`
+        :return: an array with the predicted class per input.
+        :rtype: `np.ndarray`
+        """
+        if hasattr(self.classifier, 'predict_class'):
+            return self.classifier.predict_class(x)
+        return np.argmax(self.classifier.predict(x), axis=1)
 
-    def _init_sample(self, x, y, y_p):
+    def _orthogonal_perturb(self, delta, current_samples, original_samples, nb_trials):
+        """
+        Create orthogonal perturbations for a batch of samples, `nb_trials` trials per sample.
+
+        :param delta: Current step sizes for the orthogonal step, one per sample.
+        :type delta: `np.ndarray`
+        :param current_samples: Current adversarial examples.
+        :type current_samples: `np.ndarray`
+        :param original_samples: An array with the original inputs.
+        :type original_samples: `np.ndarray`
+        :param nb_trials: Number of trials per sample.
+        :type nb_trials: `int`
+        :return: an array of possible perturbations with shape `(N, nb_trials, ...)`.
+        :rtype: `np.ndarray`
         """
-        Find initial adversarial example for the attack.
+        nb_samples = current_samples.shape[0]
+        sample_shape = current_samples.shape[1:]
+        dim = int(np.prod(sample_shape))
+
+        # Draw a single shared noise basis per call and reuse it across samples with per-sample projection and
+        # scaling: in high dimensions random directions are near-orthogonal with high probability, so direction
+        # uniformity on the tangent sphere is preserved while the RNG cost drops from N * nb_trials to nb_trials
+        # draws. Noise is generated directly in the sample dtype where possible.
+        if current_samples.dtype in (np.float32, np.float64):
+            noise = self._rng.standard_normal(size=(nb_trials, dim), dtype=current_samples.dtype)
+        else:
+            noise = self._rng.standard_normal(size=(nb_trials, dim))
+
+        # Normalize the basis rows once, with allocation-free einsum contractions followed by in-place square
+        # roots instead of np.linalg.norm, which materializes an intermediate array
+        noise_norm = np.einsum('td,td->t', noise, noise)
+        np.sqrt(noise_norm, out=noise_norm)
+        noise /= noise_norm[:, np.newaxis]
+
+        # Rescale and project the perturbations with a shape-specialized compiled kernel when numba is available
+        if HAS_NUMBA:
+            current_flat = np.ascontiguousarray(current_samples).reshape(nb_samples, dim)
+            original_flat = np.ascontiguousarray(original_samples).reshape(nb_samples, dim)
+            perturb = np.empty((nb_samples, nb_trials, dim), dtype=noise.dtype)
+            kernel = _make_orthogonal_perturb_kernel(dim)
+            kernel(perturb, noise, current_flat, original_flat, delta)
+            return perturb.reshape((nb_samples, nb_trials) + sample_shape)
+
+        direction = np.subtract(original_samples, current_samples).reshape(nb_samples, dim)
+        direction_norm = np.einsum('bd,bd->b', direction, direction)
+        np.sqrt(direction_norm, out=direction_norm)
+
+        # Project the shared basis onto the tangent plane of each sample and rescale per sample
+        unit_direction = direction / (direction_norm[:, np.newaxis] + 1e-12)
+        dots = np.einsum('td,bd->bt', noise, unit_direction)
+        perturb = noise[np.newaxis, :, :] - dots[:, :, np.newaxis] * unit_direction[:, np.newaxis, :]
+        perturb *= (delta * direction_norm)[:, np.newaxis, np.newaxis]
+
+        return perturb.reshape((nb_samples, nb_trials) + sample_shape)
+
+    def _init_sample(self, x, y, y_p, clip_min, clip_max):
+        """
+        Find initial adversarial examples for a batch of inputs.
 
-        :param x: An array with 1 original input to be attacked.
+        :param x: An array with the original inputs to be attacked.
         :type x: `np.ndarray`
-        :param y: If `self.targeted` is true, then `y` represents the target label.
-        :type y: `int`
-        :param y_p: The predicted label of x.
-        :type y_p: `int`
-        :return: an adversarial example.
+        :param y: If `self.targeted` is true, then `y` represents the target labels.
+        :type y: `np.ndarray`
+        :param y_p: The predicted labels of x.
+        :type y_p: `np.ndarray`
+        :param clip_min: Minimum clip value of the classifier inputs.
+        :type clip_min: `float`
+        :param clip_max: Maximum clip value of the classifier inputs.
+        :type clip_max: `float`
+        :return: a tuple of an array with one initial adversarial example per input, a boolean mask indicating for
+                 which inputs one was found, and the predicted labels of the initial adversarial examples.
+        :rtype: `tuple`
         """
-        clip_min, clip_max = self.classifier.clip_values
-        nprd = np.random.RandomState()
-        initial_sample = None
-
-        if self.targeted:
-            # Attack satisfied
-            if y == y_p:
-                return None
+        nb_samples = x.shape[0]
+        sample_shape = x.shape[1:]
 
-            # Attack unsatisfied yet
-            for _ in range(self.init_size):
-                random_img = nprd.uniform(clip_min, clip_max, size=x.shape).astype(x.dtype)
-                random_class = np.argmax(self.classifier.predict(np.array([random_img])), axis=1)[0]
+        init_samples = np.zeros(x.shape, dtype=x.dtype)
+        init_found = np.zeros(nb_samples, dtype=bool)
+        init_classes = y_p.copy()
 
-                if random_class == y:
-                    initial_sample = random_img
+        # For a targeted attack, inputs already classified as the target are satisfied and left untouched
+        if self.targeted:
+            pending = (y != y_p)
+        else:
+            pending = np.ones(nb_samples, dtype=bool)
+
+        # Draw the random trials for all pending inputs in capped batches: this bounds host memory for large
+        # inputs (at most ~256 candidate images in flight) and stops probing as soon as every pending input has
+        # a hit, instead of always drawing all init_size candidates. Uniforms are generated directly in the
+        # input dtype where possible to avoid a float64 intermediate and a full-batch cast.
+        remaining = np.where(pending)[0]
+        trials_done = 0
+        while remaining.size > 0 and trials_done < self.init_size:
+            nb_trials = min(self.init_size - trials_done, max(1, 256 // remaining.size))
+            probe_shape = (remaining.size * nb_trials,) + sample_shape
+
+            if self.use_fp16_probe:
+                # Probe candidates are only classified once, so half precision halves memory traffic and
+                # transfer; the selected initial samples are cast back to the input dtype on assignment below
+                random_imgs = self._rng.random(size=probe_shape, dtype=np.float32).astype(np.float16)
+                random_imgs *= (clip_max - clip_min)
+                random_imgs += clip_min
+            elif x.dtype in (np.float32, np.float64):
+                random_imgs = self._rng.random(size=probe_shape, dtype=x.dtype)
+                random_imgs *= (clip_max - clip_min)
+                random_imgs += clip_min
+            else:
+                random_imgs = self._rng.uniform(clip_min, clip_max, size=probe_shape).astype(x.dtype)
+            random_classes = self._predict_classes(random_imgs).reshape(remaining.size, nb_trials)
 
-                    logging.info('Found initial adversarial image for targeted attack.')
-                    break
+            if self.targeted:
+                hits = (random_classes == y[remaining][:, np.newaxis])
             else:
-                logging.warning('Failed to draw a random image that is adversarial, attack failed.')
+                hits = (random_classes != y_p[remaining][:, np.newaxis])
 
-        else:
-            for _ in range(self.init_size):
-                random_img = nprd.uniform(clip_min, clip_max, size=x.shape).astype(x.dtype)
-                random_class = np.argmax(self.classifier.predict(np.array([random_img])), axis=1)[0]
+            # Pick the first successful trial per input and drop satisfied inputs from further probing
+            found = hits.any(axis=1)
+            first_hit = np.argmax(hits, axis=1)
+            random_imgs = random_imgs.reshape((remaining.size, nb_trials) + sample_shape)
+            found_inds = remaining[found]
+            init_samples[found_inds] = random_imgs[found, first_hit[found]]
+            init_found[found_inds] = True
+            init_classes[found_inds] = random_classes[found, first_hit[found]]
 
-                if random_class != y_p:
-                    initial_sample = random_img
+            remaining = remaining[~found]
+            trials_done += nb_trials
 
-                    logging.info('Found initial adversarial image for untargeted attack.')
-                    break
-            else:
-                logging.warning('Failed to draw a random image that is adversarial, attack failed.')
+        if remaining.size > 0:
+            logger.warning('Failed to draw a random image that is adversarial, attack failed.')
 
-        return initial_sample
+        return init_samples, init_found, init_classes
 
     def set_params(self, **kwargs):
         """
@@ -339,17 +466,20 @@ class BoundaryAttack(Attack):
         :type sample_size: `int`
         :param init_size: Maximum number of trials for initial generation of adversarial examples.
         :type init_size: `int`
+        :param use_fp16_probe: Draw the random init candidates in half precision to reduce memory traffic and
+               host-to-device transfer. Requires a classifier that accepts float16 inputs.
+        :type use_fp16_probe: `bool`
         """
         # Save attack-specific parameters
         super(BoundaryAttack, self).set_params(**kwargs)
 
-        if not isinstance(self.max_iter, (int, np.int)) or self.max_iter <= 0:
+        if not isinstance(self.max_iter, (int, np.integer)) or self.max_iter <= 0:
             raise ValueError("The number of iterations must be a positive integer.")
 
-        if not isinstance(self.sample_size, (int, np.int)) or self.sample_size <= 0:
+        if not isinstance(self.sample_size, (int, np.integer)) or self.sample_size <= 0:
             raise ValueError("The number of trials must be a positive integer.")
 
-        if not isinstance(self.init_size, (int, np.int)) or self.init_size <= 0:
+        if not isinstance(self.init_size, (int, np.integer)) or self.init_size <= 0:
             raise ValueError("The number of trials must be a positive integer.")
 
         if self.epsilon <= 0:
@@ -166,5 +166,36 @@ class TestBoundary(unittest.TestCase):
         self.assertTrue((y_pred != y_pred_adv).any())
 
 
+class TestBoundaryOrthogonalPerturb(unittest.TestCase):
+    """
+    A unittest class for the vectorized orthogonal perturbation, exercising the numba kernel when installed.
+    """
+    def setUp(self):
+        # Set master seed
+        master_seed(1234)
+
+    def test_float32(self):
+        """
+        Test the orthogonal perturbation on float32 data, the library's standard dtype.
+        :return:
+        """
+        boundary = BoundaryAttack(classifier=None, targeted=False)
+        current = np.random.uniform(size=(4, 28, 28, 1)).astype(np.float32)
+        original = np.random.uniform(size=(4, 28, 28, 1)).astype(np.float32)
+        delta = np.full(4, 0.1)
+
+        perturb = boundary._orthogonal_perturb(delta, current, original, 5)
+
+        self.assertEqual(perturb.shape, (4, 5, 28, 28, 1))
+        self.assertEqual(perturb.dtype, np.float32)
+        self.assertTrue(np.isfinite(perturb).all())
+
+        # The perturbations must be orthogonal to the source direction of their sample
+        direction = (original - current).reshape(4, 1, -1)
+        dots = np.sum(perturb.reshape(4, 5, -1) * direction, axis=2)
+        bound = 1e-3 * np.linalg.norm(perturb.reshape(4, 5, -1), axis=2) * np.linalg.norm(direction, axis=2)
+        self.assertTrue((np.abs(dots) <= bound).all())
+
+
 if __name__ == '__main__':
     unittest.main()